@@ -1,162 +1,591 @@
 import os
 import json
+import asyncio
+import functools
+import hashlib
+import re
+import sys
+import threading
 import requests
 import time
-from datetime import datetime
-from typing import Dict, Optional
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Protocol
 from dotenv import load_dotenv
 
-from prompts import (
-    NEWSLETTER_SYSTEM_PROMPT,
-    NEWSLETTER_CONTENT_PROMPT,
-    HTML_EMAIL_TEMPLATE,
-    OLLAMA_SYSTEM_PROMPT,
-    SAMPLE_NEWSLETTER_CONTENT,
-)
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Import via the package when possible so send_to_all.py and this module
+# share one ai_agent.prompts instead of loading a second top-level copy
+try:
+    from .prompts import (
+        NEWSLETTER_SYSTEM_PROMPT,
+        NEWSLETTER_CONTENT_PROMPT,
+        OLLAMA_SYSTEM_PROMPT,
+        OLLAMA_USER_PROMPT,
+        OLLAMA_SECTION_PROMPT,
+        NEWSLETTER_SECTIONS,
+        SAMPLE_NEWSLETTER_CONTENT,
+        render_content_prompt,
+        render_email,
+    )
+except ImportError:
+    from prompts import (
+        NEWSLETTER_SYSTEM_PROMPT,
+        NEWSLETTER_CONTENT_PROMPT,
+        OLLAMA_SYSTEM_PROMPT,
+        OLLAMA_USER_PROMPT,
+        OLLAMA_SECTION_PROMPT,
+        NEWSLETTER_SECTIONS,
+        SAMPLE_NEWSLETTER_CONTENT,
+        render_content_prompt,
+        render_email,
+    )
 
 load_dotenv()
 
+OPENAI_MODEL = "gpt-3.5-turbo"
+TEMPERATURE = 0.7
+TOP_P = 0.9
+
+# (connect, read) timeouts for Ollama; generation can take a while
+OLLAMA_TIMEOUT = (3.05, 90)
+# OpenAI request timeout in seconds; defaults to the SDK's own 10 minutes
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "600"))
+
+# Responses are cached for a day by default; set AI_CACHE_TTL=0 to disable
+CACHE_DIR = Path.home() / ".cache" / "datadispatch"
+DEFAULT_CACHE_TTL = 86400
+# Sections that don't need daily refresh (see NEWSLETTER_SECTIONS) live a week
+SECTION_CACHE_TTL = 7 * 86400
+# Recent entries are also kept in process so repeat lookups skip the backend
+MEMORY_CACHE_SIZE = 32
+
+
+class OllamaAPIError(Exception):
+    """Ollama answered with an error status or an error chunk"""
+
+    def __init__(self, detail: str, status_code: Optional[int] = None):
+        super().__init__(f"Ollama API error: {detail}")
+        self.detail = detail
+        self.status_code = status_code
+
+
+class RateLimiter:
+    """Space calls evenly so no more than `per_minute` start each minute"""
+
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Shared by every generator in the process (OPENAI_RPM=0 disables it)
+_openai_rate_limiter = RateLimiter(int(os.getenv("OPENAI_RPM", "60")))
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[Dict[str, str]]: ...
+
+    def set(self, key: str, value: Dict[str, str], ttl_seconds: int) -> None: ...
+
+
+class DiskBackend:
+    """Store cached responses as JSON files under ~/.cache/datadispatch/"""
+
+    def __init__(self, directory: Path = CACHE_DIR):
+        self.directory = directory
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        try:
+            with open(self.directory / f"{key}.json", "rb") as f:
+                entry = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("expires_at", 0) < time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Dict[str, str], ttl_seconds: int) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(
+                json_dumps({"expires_at": time.time() + ttl_seconds, "value": value})
+            )
+        os.replace(tmp_path, path)
+
+
+class RedisBackend:
+    """Store cached responses in Redis (requires the redis package)"""
+
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        raw = self.client.get(f"datadispatch:llm:{key}")
+        return json_loads(raw) if raw else None
+
+    def set(self, key: str, value: Dict[str, str], ttl_seconds: int) -> None:
+        self.client.setex(f"datadispatch:llm:{key}", ttl_seconds, json_dumps(value))
+
+
+class LLMCache:
+    """Exact-match cache for generated newsletter content"""
+
+    # Shared by every cache in the process: key -> (expires_at, value)
+    _memory: "OrderedDict[str, tuple]" = OrderedDict()
+    _memory_lock = threading.Lock()
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int = DEFAULT_CACHE_TTL):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def _memory_get(cls, key: str) -> Optional[Dict[str, str]]:
+        with cls._memory_lock:
+            entry = cls._memory.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del cls._memory[key]
+                return None
+            cls._memory.move_to_end(key)
+            return entry[1]
+
+    @classmethod
+    def _memory_set(cls, key: str, value: Dict[str, str], ttl_seconds: int) -> None:
+        with cls._memory_lock:
+            cls._memory[key] = (time.time() + ttl_seconds, value)
+            cls._memory.move_to_end(key)
+            while len(cls._memory) > MEMORY_CACHE_SIZE:
+                cls._memory.popitem(last=False)
+
+    @staticmethod
+    def make_key(**fields) -> str:
+        """Hash the generation inputs into a stable cache key"""
+        raw = json.dumps(fields, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        value = self._memory_get(key)
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            print(f"⚠️  Cache lookup failed: {str(e)}")
+            value = None
+
+        if value is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+            # The backend owns the real expiry, so hold promoted copies an hour
+            self._memory_set(key, value, min(self.ttl_seconds, 3600))
+        return value
+
+    def set(
+        self, key: str, value: Dict[str, str], ttl_seconds: Optional[int] = None
+    ) -> None:
+        ttl_seconds = ttl_seconds or self.ttl_seconds
+        self._memory_set(key, value, ttl_seconds)
+        try:
+            self.backend.set(key, value, ttl_seconds)
+        except Exception as e:
+            print(f"⚠️  Cache write failed: {str(e)}")
+
+
+# User-friendly aliases mapped to official Ollama tags
+_OLLAMA_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        alias: sys.intern(tag)
+        for alias, tag in {
+            "llama:3.2:1b": "llama3.2:1b",
+            "llama3.2:1b-instruct": "llama3.2:1b",  # fallback to base model
+            "llama-3.2-1b": "llama3.2:1b",
+            "llama-3.2:1b": "llama3.2:1b",
+            # Fallbacks without instruct
+            "llama3.2": "llama3.2:1b",
+            # Mistral aliases
+            "mistral": "mistral:latest",
+            "mistral:latest": "mistral:latest",
+        }.items()
+    }
+)
+
+
+# Used when the model ignores the JSON format and returns plain text
+_NEWLINE_TO_BR = str.maketrans({"\n": "<br>"})
+# Either the text after "Subject:"/"Title:", or a whole line carrying an emoji
+_SUBJECT_LINE = re.compile(
+    r"(?:subject|title)[ \t]*:[ \t]*(.+)|^(.*(?:🚀|📧).*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Dates ("October 15, 2026") and numbers vary between otherwise identical prompts
+_PROMPT_VARIABLES = re.compile(r"\b[A-Z][a-z]+ \d{1,2}, \d{4}\b|\d+")
+
+
+def _text_section_html(title: str, text: str) -> str:
+    """Wrap a plain-text model reply as one newsletter section"""
+    return f"""
+        <div class="section">
+            <h2 class="section-title">{title}</h2>
+            <div class="section-content">
+                <div class="item">
+                    <div class="item-description">
+                        {text.strip().translate(_NEWLINE_TO_BR)}
+                    </div>
+                </div>
+            </div>
+        </div>
+        """
+
+
+def _prompt_skeleton(prompt: str) -> str:
+    """Replace the variable tokens of a prompt so its structure can be a key"""
+    return _PROMPT_VARIABLES.sub("<VAR>", prompt)
+
+
+@functools.lru_cache(maxsize=2)
+def _format_day(ordinal: int) -> str:
+    """Format a date ordinal for prompts; cached so strftime runs once a day"""
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
+def _current_date() -> str:
+    """Today's date as used in prompts and subjects, e.g. 'October 15, 2026'"""
+    # Keyed on the local date ordinal rather than time() // 86400 so the
+    # bucket rolls over at local midnight, matching what strftime would print
+    return _format_day(date.today().toordinal())
+
+
+@functools.lru_cache(maxsize=8)
+def _fallback_html(subject: str) -> str:
+    """The sample content never changes, so wrap it once per subject"""
+    return render_email(subject, SAMPLE_NEWSLETTER_CONTENT["html"])
+
+
+@functools.cache
+def _get_openai_class():
+    """Import the OpenAI SDK lazily; it is optional and slow to import"""
+    from openai import OpenAI
+
+    return OpenAI
+
 
 class ContentGenerator:
+    __slots__ = (
+        "openai_api_key",
+        "ollama_base_url",
+        "ollama_model_input",
+        "ollama_model",
+        "ollama_num_parallel",
+        "use_openai",
+        "cache",
+        "used_fallback",
+        "_http",
+        "_openai_client",
+    )
+
     def __init__(self):
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         # Default to the user's desired model alias; we'll normalize to a valid Ollama tag
         self.ollama_model_input = os.getenv("OLLAMA_MODEL", "mistral:latest")
-        self.ollama_model = self._normalize_ollama_model(self.ollama_model_input)
+        self.ollama_model = sys.intern(
+            self._normalize_ollama_model(self.ollama_model_input)
+        )
+        # Match the server's OLLAMA_NUM_PARALLEL to generate sections concurrently
+        self.ollama_num_parallel = int(os.getenv("OLLAMA_NUM_PARALLEL", "1"))
         # Select provider: default to Ollama unless explicitly set to openai
         provider = os.getenv("AI_PROVIDER", "ollama").lower()
         self.use_openai = (provider == "openai") and bool(self.openai_api_key)
+        cache_ttl = int(os.getenv("AI_CACHE_TTL", str(DEFAULT_CACHE_TTL)))
+        self.cache = (
+            LLMCache(self._create_cache_backend(), ttl_seconds=cache_ttl)
+            if cache_ttl > 0
+            else None
+        )
+        self.used_fallback = False
+        self._http = self._create_http_session()
+        self._openai_client = None
+
+    def _create_http_session(self) -> requests.Session:
+        """Pooled keep-alive session so Ollama calls reuse their connection"""
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        session.mount(self.ollama_base_url, adapter)
+        return session
+
+    def _openai(self):
+        """Build the OpenAI client on first use and reuse its connection pool"""
+        if self._openai_client is None:
+            self._openai_client = _get_openai_class()(
+                api_key=self.openai_api_key, timeout=OPENAI_TIMEOUT
+            )
+        return self._openai_client
+
+    def _create_cache_backend(self) -> CacheBackend:
+        """Use Redis when REDIS_URL is configured, otherwise the disk cache"""
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                return RedisBackend(redis_url)
+            except ImportError:
+                print("⚠️  redis library not installed. Using disk cache instead.")
+        return DiskBackend()
+
+    def _cache_key(self) -> str:
+        """
+        Build the cache key from everything that shapes the generation.
+        The date is bucketed by ISO week so a week's prompts share one entry.
+        """
+        if self.use_openai:
+            fields = {
+                "model": OPENAI_MODEL,
+                "system": NEWSLETTER_SYSTEM_PROMPT,
+                "prompt": NEWSLETTER_CONTENT_PROMPT,
+            }
+        else:
+            fields = {
+                "model": self.ollama_model,
+                "system": OLLAMA_SYSTEM_PROMPT,
+                "prompt": (
+                    OLLAMA_SECTION_PROMPT
+                    if self.ollama_num_parallel > 1
+                    else OLLAMA_USER_PROMPT
+                ),
+            }
+        return LLMCache.make_key(
+            week=date.today().strftime("%G-W%V"),
+            temperature=TEMPERATURE,
+            top_p=TOP_P,
+            **fields,
+        )
 
-    def _normalize_ollama_model(self, model: str) -> str:
+    @staticmethod
+    def _normalize_ollama_model(model: str) -> str:
         """Normalize common aliases to official Ollama tags."""
-        alias_map = {
-            # User-friendly aliases mapped to available model
-            "llama:3.2:1b": "llama3.2:1b",
-            "llama3.2:1b-instruct": "llama3.2:1b",  # fallback to base model
-            "llama-3.2-1b": "llama3.2:1b",
-            "llama-3.2:1b": "llama3.2:1b",
-            # Fallbacks without instruct
-            "llama3.2": "llama3.2:1b",
-            # Mistral aliases
-            "mistral": "mistral:latest",
-            "mistral:latest": "mistral:latest",
-        }
-        normalized = alias_map.get(model.strip().lower(), model)
         # Keep the original if it already looks like an ollama tag with a colon version
-        return normalized
+        return _OLLAMA_ALIASES.get(model.strip().lower(), model)
 
     def generate_newsletter_content(self) -> Dict[str, str]:
         """
         Generate newsletter content using AI (OpenAI or Ollama)
         Returns: Dict with 'subject' and 'html' keys
         """
+        self.used_fallback = False
+        cache_key = self._cache_key() if self.cache else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached:
+                print("⚡ Using cached newsletter content")
+                return cached
+
         try:
             if self.use_openai:
-                return self._generate_with_openai()
+                content = self._generate_with_openai()
             else:
-                return self._generate_with_ollama()
+                content = self._generate_with_ollama()
         except Exception as e:
             print(f"❌ AI generation failed: {str(e)}")
             print("📝 Using fallback sample content...")
             return self._get_fallback_content()
 
+        # Never cache the sample content, so the next run retries the AI
+        if cache_key and not self.used_fallback:
+            self.cache.set(cache_key, content)
+        return content
+
     def _generate_with_openai(self) -> Dict[str, str]:
         """Generate content using OpenAI API"""
         try:
-            from openai import OpenAI
-
-            client = OpenAI(api_key=self.openai_api_key)
+            client = self._openai()
 
-            current_date = datetime.now().strftime("%B %d, %Y")
-            prompt = NEWSLETTER_CONTENT_PROMPT.format(current_date=current_date)
+            current_date = _current_date()
+            prompt = render_content_prompt(current_date)
 
+            _openai_rate_limiter.wait()
             response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": NEWSLETTER_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
-                temperature=0.7,
+                temperature=TEMPERATURE,
                 max_tokens=2000,
+                # JSON mode guarantees a parseable object, so there is no
+                # plain-text extraction path for OpenAI
+                response_format={"type": "json_object"},
+            )
+
+            result = json_loads(response.choices[0].message.content or "")
+            if "subject" not in result or "html" not in result:
+                raise ValueError("Invalid response format from OpenAI")
+
+            # Wrap HTML content in email template
+            result["html"] = self._wrap_in_email_template(
+                result["subject"], result["html"]
+            )
+            return result
+
+        except ImportError:
+            print("❌ OpenAI library not installed. Install with: pip install openai")
+            return self._get_fallback_content()
+        except Exception as e:
+            print(f"❌ OpenAI API error: {str(e)}")
+            return self._get_fallback_content()
+
+    def _ollama_generate(self, prompt: str) -> str:
+        """Run a single Ollama generation and return the raw response text"""
+        payload = {
+            "model": self.ollama_model,
+            "prompt": prompt,
+            # Ask Ollama to enforce JSON where supported
+            "format": "json",
+            # Stream NDJSON chunks so tokens are consumed as they are produced
+            "stream": True,
+            "options": {"temperature": TEMPERATURE, "top_p": TOP_P},
+        }
+
+        with self._http.post(
+            f"{self.ollama_base_url}/api/generate",
+            data=json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=OLLAMA_TIMEOUT,
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                raise OllamaAPIError(
+                    f"{response.status_code} - {response.text}", response.status_code
+                )
+
+            buffer = bytearray()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json_loads(line)
+                if "error" in chunk:
+                    raise OllamaAPIError(chunk["error"])
+                buffer.extend(chunk.get("response", "").encode("utf-8"))
+                if chunk.get("done"):
+                    break
+
+        return buffer.decode("utf-8").strip()
+
+    def _generate_with_ollama(self) -> Dict[str, str]:
+        """Generate content using Ollama local LLM"""
+        if self.ollama_num_parallel > 1:
+            return asyncio.run(self._generate_with_ollama_async())
+
+        try:
+            current_date = _current_date()
+            user_prompt = OLLAMA_USER_PROMPT.format(
+                system_prompt=OLLAMA_SYSTEM_PROMPT, current_date=current_date
             )
 
-            content = (response.choices[0].message.content or "").strip()
+            content = self._ollama_generate(user_prompt)
 
             # Try to parse JSON response
             try:
-                result = json.loads(content)
-                if "subject" in result and "html" in result:
+                parsed = json_loads(content)
+                if "subject" in parsed and "html" in parsed:
                     # Wrap HTML content in email template
-                    result["html"] = self._wrap_in_email_template(
-                        result["subject"], result["html"]
+                    parsed["html"] = self._wrap_in_email_template(
+                        parsed["subject"], parsed["html"]
                     )
-                    return result
+                    return parsed
                 else:
-                    raise ValueError("Invalid response format from OpenAI")
+                    raise ValueError("Invalid response format from Ollama")
             except json.JSONDecodeError:
                 # If not JSON, try to extract content
                 return self._extract_content_from_text(content)
 
-        except ImportError:
-            print("❌ OpenAI library not installed. Install with: pip install openai")
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Ollama connection error: {str(e)}")
+            print("💡 Make sure Ollama is running: ollama serve")
+            print(f"💡 If model not present, pull it: ollama pull {self.ollama_model}")
             return self._get_fallback_content()
         except Exception as e:
-            print(f"❌ OpenAI API error: {str(e)}")
+            print(f"❌ Ollama error: {str(e)}")
             return self._get_fallback_content()
 
-    def _generate_with_ollama(self) -> Dict[str, str]:
-        """Generate content using Ollama local LLM"""
+    async def _generate_with_ollama_async(self) -> Dict[str, str]:
+        """
+        Generate each newsletter section as its own Ollama request and run
+        them concurrently. Latency approaches the slowest section instead of
+        the sum when the server runs with OLLAMA_NUM_PARALLEL > 1.
+        """
         try:
-            current_date = datetime.now().strftime("%B %d, %Y")
-            user_prompt = f"""
-            {OLLAMA_SYSTEM_PROMPT}
-            
-            Generate a tech newsletter for {current_date}. Include:
-            - Latest AI developments
-            - New developer tools
-            - Programming insights
-            - Quick tips for developers
-            
-            Return only valid JSON with 'subject' and 'html' keys.
-            Subject max 60 characters.
-            """
-
-            payload = {
-                "model": self.ollama_model,
-                "prompt": user_prompt,
-                # Ask Ollama to enforce JSON where supported
-                "format": "json",
-                "stream": False,
-                "options": {"temperature": 0.7, "top_p": 0.9},
-            }
-
-            response = requests.post(
-                f"{self.ollama_base_url}/api/generate", json=payload, timeout=90
+            current_date = _current_date()
+            section_prompt = OLLAMA_SECTION_PROMPT
+            system_prompt = OLLAMA_SYSTEM_PROMPT
+            prompts = [
+                section_prompt.format(
+                    system_prompt=system_prompt,
+                    section_title=title,
+                    section_brief=brief,
+                    current_date=current_date,
+                )
+                for title, brief, _ in NEWSLETTER_SECTIONS
+            ]
+
+            # Never queue more requests than the server has parallel slots;
+            # extra in-flight requests only wait in Ollama's own queue
+            semaphore = asyncio.Semaphore(self.ollama_num_parallel)
+            sections = await asyncio.gather(
+                *(
+                    self._generate_section(prompt, title, static, semaphore)
+                    for prompt, (title, _, static) in zip(prompts, NEWSLETTER_SECTIONS)
+                )
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result.get("response", "").strip()
-
-                # Try to parse JSON response
-                try:
-                    parsed = json.loads(content)
-                    if "subject" in parsed and "html" in parsed:
-                        # Wrap HTML content in email template
-                        parsed["html"] = self._wrap_in_email_template(
-                            parsed["subject"], parsed["html"]
-                        )
-                        return parsed
-                    else:
-                        raise ValueError("Invalid response format from Ollama")
-                except json.JSONDecodeError:
-                    # If not JSON, try to extract content
-                    return self._extract_content_from_text(content)
-            else:
-                raise Exception(
-                    f"Ollama API error: {response.status_code} - {response.text}"
-                )
+            subject = sections[0].get("subject") or "🚀 Weekly AI & Tech Update"
+            html = '\n<hr class="divider">\n'.join(s["html"] for s in sections)
+            return {
+                "subject": subject,
+                "html": self._wrap_in_email_template(subject, html),
+            }
 
         except requests.exceptions.RequestException as e:
             print(f"❌ Ollama connection error: {str(e)}")
@@ -167,37 +596,58 @@ class ContentGenerator:
             print(f"❌ Ollama error: {str(e)}")
             return self._get_fallback_content()
 
+    async def _generate_section(
+        self, prompt: str, title: str, static: bool, semaphore: asyncio.Semaphore
+    ) -> Dict[str, str]:
+        """
+        Generate one newsletter section. Static sections are cached by their
+        prompt skeleton so they are reused across days until the entry expires.
+        A section that isn't valid JSON keeps its text instead of failing the
+        whole newsletter.
+        """
+        cache_key = None
+        if static and self.cache:
+            cache_key = LLMCache.make_key(
+                model=self.ollama_model,
+                skeleton=_prompt_skeleton(prompt),
+                temperature=TEMPERATURE,
+                top_p=TOP_P,
+            )
+            cached = self.cache.get(cache_key)
+            if cached:
+                return cached
+
+        # The pooled session is thread-safe for concurrent requests
+        async with semaphore:
+            response = await asyncio.to_thread(self._ollama_generate, prompt)
+        try:
+            section = json_loads(response)
+        except ValueError:
+            section = None
+        if not isinstance(section, dict) or "html" not in section:
+            print(f"⚠️  Section '{title}' was not valid JSON, using its text")
+            return {"html": _text_section_html(title, response)}
+
+        if cache_key:
+            self.cache.set(cache_key, section, ttl_seconds=SECTION_CACHE_TTL)
+        return section
+
     def _wrap_in_email_template(self, subject: str, content: str) -> str:
         """Wrap content in HTML email template"""
-        return HTML_EMAIL_TEMPLATE.format(subject=subject, content_sections=content)
+        return render_email(subject, content)
 
     def _extract_content_from_text(self, text: str) -> Dict[str, str]:
         """Extract content from non-JSON text response"""
         # Simple fallback if AI doesn't return proper JSON
-        lines = text.split("\n")
         subject = "🚀 Weekly AI & Tech Update"
 
         # Try to find a subject line
-        for line in lines:
-            if any(word in line.lower() for word in ["subject:", "title:", "🚀", "📧"]):
-                subject = (
-                    line.replace("Subject:", "").replace("Title:", "").strip()[:60]
-                )
-                break
+        match = _SUBJECT_LINE.search(text)
+        if match:
+            subject = (match.group(1) or match.group(2)).strip()[:60]
 
         # Use the full text as HTML content
-        html_content = f"""
-        <div class="section">
-            <h2 class="section-title">📝 This Week's Update</h2>
-            <div class="section-content">
-                <div class="item">
-                    <div class="item-description">
-                        {text.replace('\n', '<br>')}
-                    </div>
-                </div>
-            </div>
-        </div>
-        """
+        html_content = _text_section_html("📝 This Week's Update", text)
 
         return {
             "subject": subject,
@@ -206,64 +656,88 @@ class ContentGenerator:
 
     def _get_fallback_content(self) -> Dict[str, str]:
         """Return fallback content when AI generation fails"""
-        current_date = datetime.now().strftime("%B %d, %Y")
+        self.used_fallback = True
+        current_date = _current_date()
 
         # Use sample content with current date
-        content = SAMPLE_NEWSLETTER_CONTENT.copy()
-        content["subject"] = f"🚀 Tech Update for {current_date}"
-        content["html"] = self._wrap_in_email_template(
-            content["subject"], content["html"]
-        )
-
-        return content
+        subject = f"🚀 Tech Update for {current_date}"
+        return {"subject": subject, "html": _fallback_html(subject)}
 
     def test_ai_connection(self) -> Dict[str, bool]:
         """Test AI service connections"""
-        results = {"openai": False, "ollama": False}
+        return {"openai": self._test_openai(), "ollama": self._test_ollama()}
 
-        # Test OpenAI
-        if self.openai_api_key:
-            try:
-                from openai import OpenAI
+    async def probe_all(self) -> Dict[str, bool]:
+        """
+        Run the OpenAI and Ollama probes concurrently, and preload the Ollama
+        model meanwhile so the first generation doesn't pay the load time.
+        """
+        probes = [
+            asyncio.to_thread(self._test_openai),
+            asyncio.to_thread(self._test_ollama),
+        ]
+        if not self.use_openai:
+            probes.append(asyncio.to_thread(self._warm_up_ollama))
 
-                client = OpenAI(api_key=self.openai_api_key)
+        openai_ok, ollama_ok, *_ = await asyncio.gather(*probes)
+        return {"openai": openai_ok, "ollama": ollama_ok}
 
-                # Simple test request
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": "Hello"}],
-                    max_tokens=5,
-                )
-                results["openai"] = True
-                print("✅ OpenAI connection successful")
-            except Exception as e:
-                print(f"❌ OpenAI connection failed: {str(e)}")
+    def _test_openai(self) -> bool:
+        if not self.openai_api_key:
+            return False
 
-        # Test Ollama
         try:
-            response = requests.get(f"{self.ollama_base_url}/api/tags", timeout=5)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                model_names = [m.get("name", "") for m in models]
-                if any(
-                    self.ollama_model in name or name.startswith(self.ollama_model)
-                    for name in model_names
-                ):
-                    results["ollama"] = True
-                    print(
-                        f"✅ Ollama connection successful (model: {self.ollama_model})"
-                    )
-                else:
-                    print(
-                        f"❌ Ollama model '{self.ollama_model}' not found. Available: {', '.join(model_names) or 'none'}"
-                    )
-                    print(f"💡 Pull the model: ollama pull {self.ollama_model}")
-            else:
+            client = self._openai()
+
+            # Simple test request
+            client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[{"role": "user", "content": "Hello"}],
+                max_tokens=5,
+            )
+            print("✅ OpenAI connection successful")
+            return True
+        except Exception as e:
+            print(f"❌ OpenAI connection failed: {str(e)}")
+            return False
+
+    def _test_ollama(self) -> bool:
+        try:
+            response = self._http.get(f"{self.ollama_base_url}/api/tags", timeout=5)
+            if response.status_code != 200:
                 print(f"❌ Ollama API error: {response.status_code}")
+                return False
+
+            models = json_loads(response.content).get("models", [])
+            model_names = frozenset(m.get("name", "") for m in models)
+            # Exact tag is the common case; only then scan for partial matches
+            if self.ollama_model in model_names or any(
+                self.ollama_model in name for name in model_names
+            ):
+                print(f"✅ Ollama connection successful (model: {self.ollama_model})")
+                return True
+
+            print(
+                f"❌ Ollama model '{self.ollama_model}' not found. Available: {', '.join(sorted(model_names)) or 'none'}"
+            )
+            print(f"💡 Pull the model: ollama pull {self.ollama_model}")
+            return False
         except Exception as e:
             print(f"❌ Ollama connection failed: {str(e)}")
+            return False
 
-        return results
+    def _warm_up_ollama(self) -> None:
+        """Ask Ollama to load the model; a request without a prompt only loads it"""
+        try:
+            self._http.post(
+                f"{self.ollama_base_url}/api/generate",
+                data=json_dumps({"model": self.ollama_model}),
+                headers={"Content-Type": "application/json"},
+                timeout=OLLAMA_TIMEOUT,
+            )
+        except requests.exceptions.RequestException:
+            # The Ollama probe already reports connection problems
+            pass
 
 
 def main():
@@ -274,7 +748,7 @@ def main():
 
     # Test connections
     print("\n📡 Testing AI connections...")
-    connections = generator.test_ai_connection()
+    connections = asyncio.run(generator.probe_all())
 
     if not any(connections.values()):
         print("⚠️  No AI services available. Will use fallback content.")
@@ -291,6 +765,8 @@ def main():
     print(f"✅ Content generated in {generation_time}s")
     print(f"📧 Subject: {content['subject']}")
     print(f"📄 HTML length: {len(content['html'])} characters")
+    if generator.cache:
+        print(f"🗄️  Cache stats: {generator.cache.stats}")
 
     # Save to file for inspection
     with open("/tmp/sample_newsletter.html", "w", encoding="utf-8") as f:
@@ -1,5 +1,7 @@
 # AI Prompts for Newsletter Content Generation
 
+import re
+
 NEWSLETTER_SYSTEM_PROMPT = """
 You are an AI assistant that generates high-quality newsletter content for DataDispatch, 
 a tech-focused publication. Your goal is to create engaging, informative, and well-structured 
@@ -131,6 +133,40 @@ Return only valid JSON with 'subject' and 'html' keys. The HTML should be email-
 Keep the subject under 60 characters and make the content valuable for developers.
 """
 
+OLLAMA_USER_PROMPT = """
+{system_prompt}
+
+Generate a tech newsletter for {current_date}. Include:
+- Latest AI developments
+- New developer tools
+- Programming insights
+- Quick tips for developers
+
+Return only valid JSON with 'subject' and 'html' keys.
+Subject max 60 characters.
+"""
+
+# Used when OLLAMA_NUM_PARALLEL > 1: each section is generated by its own request
+OLLAMA_SECTION_PROMPT = """
+{system_prompt}
+
+Write only the "{section_title}" section of the tech newsletter for {current_date}.
+Cover: {section_brief}
+
+Return only valid JSON with 'subject' and 'html' keys.
+The html must be a single <div class="section"> with an <h2 class="section-title"> heading.
+Subject max 60 characters.
+"""
+
+# (title, brief, static) - static sections don't need a daily refresh and are
+# served from the section cache while it is warm
+NEWSLETTER_SECTIONS = [
+    ("This Week's Highlights", "3-4 of the latest AI and tech developments", False),
+    ("Tools & Resources", "2-3 new developer tools or resources", True),
+    ("Learning", "educational content, tutorials, or industry insights", True),
+    ("Quick Tips", "actionable tips developers can implement immediately", False),
+]
+
 SAMPLE_NEWSLETTER_CONTENT = {
     "subject": "AI Breakthroughs & Dev Tools You Need This Week",
     "html": """
@@ -205,3 +241,48 @@ SAMPLE_NEWSLETTER_CONTENT = {
     </div>
     """,
 }
+
+
+# Templates are pre-split once at import so rendering is a plain join. The
+# doubled braces only exist for str.format, so they are unescaped up front.
+(
+    _EMAIL_HEAD,
+    _EMAIL_SLOT_1,
+    _EMAIL_TITLE_TO_HEADER,
+    _EMAIL_SLOT_2,
+    _EMAIL_HEADER_TO_CONTENT,
+    _EMAIL_SLOT_3,
+    _EMAIL_TAIL,
+) = re.split(
+    r"\{(subject|content_sections)\}",
+    HTML_EMAIL_TEMPLATE.replace("{{", "{").replace("}}", "}"),
+)
+assert (_EMAIL_SLOT_1, _EMAIL_SLOT_2, _EMAIL_SLOT_3) == (
+    "subject",
+    "subject",
+    "content_sections",
+), "HTML_EMAIL_TEMPLATE slot order changed; update render_email"
+
+_CONTENT_PROMPT_HEAD, _, _CONTENT_PROMPT_TAIL = NEWSLETTER_CONTENT_PROMPT.partition(
+    "{current_date}"
+)
+
+
+def render_email(subject: str, content_sections: str) -> str:
+    """Fill HTML_EMAIL_TEMPLATE with a subject and its content sections"""
+    return "".join(
+        (
+            _EMAIL_HEAD,
+            subject,
+            _EMAIL_TITLE_TO_HEADER,
+            subject,
+            _EMAIL_HEADER_TO_CONTENT,
+            content_sections,
+            _EMAIL_TAIL,
+        )
+    )
+
+
+def render_content_prompt(current_date: str) -> str:
+    """Fill NEWSLETTER_CONTENT_PROMPT with the current date"""
+    return _CONTENT_PROMPT_HEAD + current_date + _CONTENT_PROMPT_TAIL
@@ -1,18 +1,36 @@
+import asyncio
 import sqlite3
 import os
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import create_engine, Integer, String, DateTime, Text
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy import (
+    Integer,
+    String,
+    DateTime,
+    Text,
+    Index,
+    bindparam,
+    event,
+    insert,
+    select,
+    func,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import (
     declarative_base,
-    sessionmaker,
-    Session,
     Mapped,
     mapped_column,
 )
 
 try:
     from dotenv import load_dotenv
+
     load_dotenv()
 except ImportError:
     print("Warning: python-dotenv not installed. Using environment variables directly.")
@@ -20,17 +38,77 @@ except ImportError:
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./newsletter.db")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+
+def get_async_database_url(url: str) -> str:
+    """Point the configured URL at an async driver (aiosqlite / asyncpg)"""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+# The API and the scripts share this one engine and its connection pool.
+# Only a few dozen statement shapes are ever cached (multi-row upserts
+# carry no cache key and compile per call), so SQLAlchemy's default of 500
+# compiled statements is plenty; it is set here so both engines share it.
+QUERY_CACHE_SIZE = 500
+
+if "sqlite" in DATABASE_URL:
+    engine = create_async_engine(
+        get_async_database_url(DATABASE_URL),
+        query_cache_size=QUERY_CACHE_SIZE,
+        # sqlite3 keeps parsed statements per connection; the default is 128
+        connect_args={"check_same_thread": False, "cached_statements": 256},
+    )
+else:
+    engine = create_async_engine(
+        get_async_database_url(DATABASE_URL),
+        query_cache_size=QUERY_CACHE_SIZE,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL + NORMAL sync avoids an fsync per commit on pooled connections"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+# INSERT ... ON CONFLICT is dialect specific
+upsert_insert = pg_insert if engine.dialect.name == "postgresql" else sqlite_insert
+
+
+def utc_now():
+    """
+    Database-side current time as naive UTC. SQLite's CURRENT_TIMESTAMP is
+    already UTC; Postgres now() follows the session time zone
+    """
+    if engine.dialect.name == "postgresql":
+        return func.timezone("utc", func.now())
+    return func.now()
+
+
+SessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
 # Database Models
 class Subscriber(Base):
     __tablename__ = "subscribers"
+    # Covers "emails WHERE status = ?" so recipient scans never touch the table
+    __table_args__ = (Index("ix_subscribers_status_email", "status", "email"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     email: Mapped[str] = mapped_column(
@@ -39,9 +117,13 @@ class Subscriber(Base):
     status: Mapped[str] = mapped_column(
         String(50), default="active"
     )  # active, unsubscribed
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Timestamps come from the database clock instead of a Python call per row;
+    # default= keeps tables created before server_default existed working
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utc_now(), server_default=utc_now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=utc_now(), server_default=utc_now(), onupdate=utc_now()
     )
 
 
@@ -49,7 +131,9 @@ class SendLog(Base):
     __tablename__ = "send_logs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    date: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    date: Mapped[datetime] = mapped_column(
+        DateTime, default=utc_now(), server_default=utc_now(), index=True
+    )
     sent_count: Mapped[int] = mapped_column(Integer, default=0)
     failures: Mapped[int] = mapped_column(Integer, default=0)
     latency_ms: Mapped[int] = mapped_column(Integer, default=0)
@@ -59,53 +143,96 @@ class SendLog(Base):
     )
 
 
+# Statements run on every send or stats request, built once at import
+_SUBSCRIBERS_BY_STATUS = select(Subscriber).where(
+    Subscriber.status == bindparam("status")
+)
+_EMAILS_BY_STATUS = (
+    select(Subscriber.email)
+    .where(Subscriber.status == bindparam("status"))
+    .execution_options(yield_per=1000)
+)
+# Keyset pages over ix_subscribers_status_email
+_EMAIL_PAGE_BY_STATUS = (
+    select(Subscriber.email)
+    .where(
+        Subscriber.status == bindparam("status"),
+        Subscriber.email > bindparam("after"),
+    )
+    .order_by(Subscriber.email)
+    .limit(bindparam("limit"))
+)
+_COUNT_BY_STATUS = select(Subscriber.status, func.count()).group_by(Subscriber.status)
+_INSERT_SEND_LOG = insert(SendLog).returning(SendLog)
+
+
 # Create tables
-def create_tables():
-    Base.metadata.create_all(bind=engine)
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all skips existing tables, so add indexes introduced since
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                await conn.run_sync(index.create, checkfirst=True)
 
 
 # Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Database operations
 class SubscriberDB:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_subscriber(self, email: str) -> Subscriber:
-        """Create a new subscriber"""
-        # Check if already exists
-        existing = self.get_subscriber_by_email(email)
-        if existing:
-            if existing.status == "unsubscribed":
-                # Reactivate unsubscribed user
-                existing.status = "active"
-                existing.updated_at = datetime.utcnow()
-                self.db.commit()
-                self.db.refresh(existing)
-                return existing
-            else:
-                raise ValueError("Email already subscribed")
-
-        subscriber = Subscriber(email=email, status="active")
-        self.db.add(subscriber)
-        self.db.commit()
-        self.db.refresh(subscriber)
+    async def create_subscriber(self, email: str) -> Subscriber:
+        """Create a new subscriber, or reactivate an unsubscribed one"""
+        subscriber = (await self.create_subscribers([email])).get(email)
+        if subscriber is None:
+            raise ValueError("Email already subscribed")
         return subscriber
 
-    def get_subscriber_by_email(self, email: str) -> Optional[Subscriber]:
+    async def create_subscribers(self, emails: List[str]) -> Dict[str, Subscriber]:
+        """
+        Create or reactivate several subscribers in one statement and one commit.
+        Returns the affected rows by email; emails that are missing were
+        already subscribed.
+        """
+        # A single upsert covers new and reactivated subscribers; when the
+        # email is already active the WHERE clause skips the update and no
+        # row comes back
+        stmt = (
+            upsert_insert(Subscriber)
+            .values(
+                [
+                    {"email": email, "status": "active"}
+                    for email in dict.fromkeys(emails)
+                ]
+            )
+            .on_conflict_do_update(
+                index_elements=[Subscriber.email],
+                set_={"status": "active", "updated_at": utc_now()},
+                where=(Subscriber.status == "unsubscribed"),
+            )
+            .returning(Subscriber)
+        )
+        result = await self.db.execute(stmt)
+        subscribers = {subscriber.email: subscriber for subscriber in result.scalars()}
+        await self.db.commit()
+        return subscribers
+
+    async def get_subscriber_by_email(self, email: str) -> Optional[Subscriber]:
         """Get subscriber by email"""
-        return self.db.query(Subscriber).filter(Subscriber.email == email).first()
+        result = await self.db.execute(
+            select(Subscriber).where(Subscriber.email == email)
+        )
+        return result.scalar_one_or_none()
 
-    def unsubscribe_subscriber(self, email: str) -> bool:
+    async def unsubscribe_subscriber(self, email: str) -> bool:
         """Unsubscribe a subscriber"""
-        subscriber = self.get_subscriber_by_email(email)
+        subscriber = await self.get_subscriber_by_email(email)
         if not subscriber:
             raise ValueError("Email not found in subscriber list")
 
@@ -113,38 +240,162 @@ class SubscriberDB:
             raise ValueError("Email already unsubscribed")
 
         subscriber.status = "unsubscribed"
-        subscriber.updated_at = datetime.utcnow()
-        self.db.commit()
+        await self.db.commit()
         return True
 
-    def get_active_subscribers(self) -> List[Subscriber]:
+    async def get_active_subscribers(self) -> List[Subscriber]:
         """Get all active subscribers"""
-        return self.db.query(Subscriber).filter(Subscriber.status == "active").all()
+        result = await self.db.execute(_SUBSCRIBERS_BY_STATUS, {"status": "active"})
+        return list(result.scalars().all())
+
+    async def iter_active_emails(self) -> AsyncIterator[str]:
+        """Stream active subscriber emails without loading whole rows"""
+        result = await self.db.stream_scalars(_EMAILS_BY_STATUS, {"status": "active"})
+        async for email in result:
+            yield email
+
+    async def get_active_emails_page(
+        self, after: str = "", limit: int = 1000
+    ) -> List[str]:
+        """Up to `limit` active emails that sort after `after`, in email order"""
+        result = await self.db.scalars(
+            _EMAIL_PAGE_BY_STATUS, {"status": "active", "after": after, "limit": limit}
+        )
+        return list(result)
 
-    def get_subscriber_count(self) -> dict:
+    async def get_subscriber_count(self) -> dict:
         """Get subscriber statistics"""
-        active_count = (
-            self.db.query(Subscriber).filter(Subscriber.status == "active").count()
-        )
-        total_count = self.db.query(Subscriber).count()
-        unsubscribed_count = (
-            self.db.query(Subscriber)
-            .filter(Subscriber.status == "unsubscribed")
-            .count()
-        )
+        result = await self.db.execute(_COUNT_BY_STATUS)
+        counts = {status: count for status, count in result.all()}
 
         return {
-            "active": active_count,
-            "total": total_count,
-            "unsubscribed": unsubscribed_count,
+            "active": counts.get("active", 0),
+            "total": sum(counts.values()),
+            "unsubscribed": counts.get("unsubscribed", 0),
         }
 
 
+class SubscribeBatcher:
+    """
+    Coalesce concurrent subscribe requests into one upsert and one commit.
+    A background task collects up to MAX_BATCH emails, waiting at most
+    MAX_DELAY seconds after the first, then answers each caller's future.
+    """
+
+    MAX_BATCH = 128
+    MAX_DELAY = 0.02
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Subscribe queue stopped"))
+
+    async def subscribe(self, email: str) -> Subscriber:
+        """Queue a subscribe; raises ValueError if already subscribed"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((email, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.MAX_DELAY
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write(batch)
+            except Exception as e:
+                # Keep draining the queue; only this batch's callers see it
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _write(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            async with SessionLocal() as db:
+                created = await SubscriberDB(db).create_subscribers(
+                    [email for email, _ in batch]
+                )
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                # One bad row fails the whole statement; retry one by one so
+                # only its caller gets the error
+                await self._write_each(batch)
+            return
+
+        for email, future in batch:
+            if future.done():  # the request was cancelled
+                continue
+            # pop() so a repeated email in the same batch is "already subscribed"
+            subscriber = created.pop(email, None)
+            if subscriber is None:
+                future.set_exception(ValueError("Email already subscribed"))
+            else:
+                future.set_result(subscriber)
+
+    async def _write_each(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        for email, future in batch:
+            if future.done():
+                continue
+            try:
+                async with SessionLocal() as db:
+                    subscriber = await SubscriberDB(db).create_subscriber(email)
+            except Exception as e:
+                # The caller may have been cancelled during the write
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(subscriber)
+
+
 class SendLogDB:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_send_log(
+    async def create_send_logs(self, rows: List[dict]) -> int:
+        """
+        Insert several send log entries (dicts of create_send_log's arguments)
+        with one executemany and one commit; returns how many were written
+        """
+        if not rows:
+            return 0
+
+        await self.db.execute(insert(SendLog), rows)
+        await self.db.commit()
+        return len(rows)
+
+    async def create_send_log(
         self,
         sent_count: int,
         failures: int,
@@ -153,27 +404,46 @@ class SendLogDB:
         newsletter_subject: Optional[str] = None,
     ) -> SendLog:
         """Create a new send log entry"""
-        log = SendLog(
-            sent_count=sent_count,
-            failures=failures,
-            latency_ms=latency_ms,
-            error_details=error_details,
-            newsletter_subject=newsletter_subject,
+        # A Core INSERT ... RETURNING skips the unit of work and comes back
+        # with id and date filled in
+        result = await self.db.execute(
+            _INSERT_SEND_LOG,
+            {
+                "sent_count": sent_count,
+                "failures": failures,
+                "latency_ms": latency_ms,
+                "error_details": error_details,
+                "newsletter_subject": newsletter_subject,
+            },
         )
-        self.db.add(log)
-        self.db.commit()
-        self.db.refresh(log)
+        log = result.scalar_one()
+        await self.db.commit()
         return log
 
-    def get_recent_logs(self, limit: int = 10) -> List[SendLog]:
+    async def get_recent_logs(self, limit: int = 10) -> List[SendLog]:
         """Get recent send logs"""
-        return self.db.query(SendLog).order_by(SendLog.date.desc()).limit(limit).all()
+        # CURRENT_TIMESTAMP has whole-second resolution on SQLite, so the id
+        # breaks ties between logs written in the same second
+        result = await self.db.execute(
+            select(SendLog)
+            .order_by(SendLog.date.desc(), SendLog.id.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
 
-    def get_send_statistics(self) -> dict:
+    async def get_send_statistics(self) -> dict:
         """Get sending statistics"""
-        logs = self.db.query(SendLog).all()
+        result = await self.db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(SendLog.sent_count), 0),
+                func.coalesce(func.sum(SendLog.failures), 0),
+                func.coalesce(func.avg(SendLog.latency_ms), 0.0),
+            ).select_from(SendLog)
+        )
+        log_count, total_sent, total_failures, average_latency = result.one()
 
-        if not logs:
+        if not log_count:
             return {
                 "total_sent": 0,
                 "total_failures": 0,
@@ -181,9 +451,6 @@ class SendLogDB:
                 "success_rate": 0,
             }
 
-        total_sent = sum(log.sent_count for log in logs)
-        total_failures = sum(log.failures for log in logs)
-        average_latency = sum(log.latency_ms for log in logs) / len(logs)
         success_rate = (
             (total_sent / (total_sent + total_failures)) * 100
             if (total_sent + total_failures) > 0
@@ -199,11 +466,18 @@ class SendLogDB:
 
 
 # Initialize database
-def init_db():
-    """Initialize database with tables"""
-    create_tables()
+_initialized = False
+
+
+async def init_db():
+    """Initialize database with tables (once per process)"""
+    global _initialized
+    if _initialized:
+        return
+    await create_tables()
+    _initialized = True
     print("Database initialized successfully!")
 
 
 if __name__ == "__main__":
-    init_db()
+    asyncio.run(init_db())
@@ -1,37 +1,87 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
+import orjson
 import os
-from datetime import datetime
-import traceback
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 from dotenv import load_dotenv
 
 # Import our modules
-from .database import SubscriberDB, init_db
-from .models import SubscribeRequest, UnsubscribeRequest, APIResponse
+from .database import SubscriberDB, SubscribeBatcher, init_db, get_db
+from .models import SubscribeRequest, UnsubscribeRequest
 
 # Load environment variables
 load_dotenv()
 
-# Database session dependency
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./newsletter.db")
-engine = create_engine(
-    DATABASE_URL,
-    connect_args=(
-        {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-    ),
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Handlers only enqueue log records; a background thread does the writing
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+logger = logging.getLogger("datadispatch.api")
+logger.addHandler(QueueHandler(_log_queue))
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# (epoch second, ISO string) of the last formatted timestamp
+_last_timestamp = (0, "")
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO string, formatted at most once per second"""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)))
+    return _last_timestamp[1]
+
+
+# /stats is a read-mostly endpoint, so counts are reused for a few seconds
+# and dropped whenever a subscribe/unsubscribe changes them
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "5"))
+_stats_cache = {"value": None, "expires_at": 0.0}
+_stats_lock = asyncio.Lock()
+
+
+async def get_cached_subscriber_count(db: AsyncSession) -> dict:
+    """Subscriber counts, recomputed at most once per STATS_CACHE_TTL"""
+    if (
+        _stats_cache["value"] is not None
+        and time.monotonic() < _stats_cache["expires_at"]
+    ):
+        return _stats_cache["value"]
+
+    async with _stats_lock:
+        # Another request may have refreshed it while we waited
+        if (
+            _stats_cache["value"] is None
+            or time.monotonic() >= _stats_cache["expires_at"]
+        ):
+            _stats_cache["value"] = await SubscriberDB(db).get_subscriber_count()
+            _stats_cache["expires_at"] = time.monotonic() + STATS_CACHE_TTL
+        return _stats_cache["value"]
+
+
+def invalidate_stats_cache() -> None:
+    _stats_cache["value"] = None
+
+
+def api_response(success: bool, message: str, data: Optional[dict] = None) -> dict:
+    """
+    Same shape as models.APIResponse, built as a plain dict so the response
+    isn't validated again on the way out
+    """
+    return {"success": success, "message": message, "data": data}
+
+
+# Concurrent subscribes are written together in one transaction
+subscribe_batcher = SubscribeBatcher()
 
 
 # Initialize FastAPI app
@@ -39,6 +89,7 @@ app = FastAPI(
     title="DataDispatch API",
     description="Backend API for DataDispatch AI-powered newsletter platform",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -57,40 +108,78 @@ origins = [
 # Remove empty strings from origins
 origins = [origin for origin in origins if origin]
 
+
+class OriginSetCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that checks exact origins with a set lookup first"""
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allowed_origin_set = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self.allowed_origin_set:
+            return True
+        # Only configured in DEV_MODE
+        return (
+            self.allow_origin_regex is not None
+            and self.allow_origin_regex.fullmatch(origin) is not None
+        )
+
+
 app.add_middleware(
-    CORSMiddleware,
+    OriginSetCORSMiddleware,
     allow_origins=origins,
     allow_origin_regex=".*" if DEV_MODE else None,  # in dev, allow all origins
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let Starlette precompute its preflight response headers
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    init_db()
-    print("✅ DataDispatch API started successfully!")
-    print(f"📧 CORS enabled for: {origins}")
+    _log_listener.start()
+    await init_db()
+    subscribe_batcher.start()
+    logger.info("✅ DataDispatch API started successfully!")
+    logger.info("📧 CORS enabled for: %s", origins)
     if DEV_MODE:
-        print("🔓 DEV_MODE CORS regex enabled: allow all origins")
+        logger.info("🔓 DEV_MODE CORS regex enabled: allow all origins")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await subscribe_batcher.stop()
+    _log_listener.stop()
+
+
+# Health check endpoint; load balancers poll it, so the body is encoded at
+# most once per second
+_health_body = (0, b"")
 
 
-# Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    global _health_body
+    now = int(time.time())
+    if now != _health_body[0]:
+        _health_body = (
+            now,
+            orjson.dumps({"status": "healthy", "timestamp": utc_timestamp()}),
+        )
+    return Response(_health_body[1], media_type="application/json")
 
 
 # Subscribe endpoint
-@app.post("/subscribe", response_model=APIResponse)
-async def subscribe(request: SubscribeRequest, db: Session = Depends(get_db)):
+@app.post("/subscribe")
+async def subscribe(request: SubscribeRequest):
     try:
-        subscriber_db = SubscriberDB(db)
-        subscriber = subscriber_db.create_subscriber(request.email)
+        subscriber = await subscribe_batcher.subscribe(request.email)
+        invalidate_stats_cache()
 
-        return APIResponse(
+        return api_response(
             success=True,
             message="Successfully subscribed to newsletter!",
             data={
@@ -102,15 +191,14 @@ async def subscribe(request: SubscribeRequest, db: Session = Depends(get_db)):
     except ValueError as e:
         error_message = str(e)
         if "already subscribed" in error_message:
-            return APIResponse(
+            return api_response(
                 success=False,
                 message="This email is already subscribed to our newsletter.",
             )
         else:
-            return APIResponse(success=False, message=error_message)
+            return api_response(success=False, message=error_message)
     except Exception as e:
-        print(f"❌ Subscribe error: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("❌ Subscribe error: %s", e)
         raise HTTPException(
             status_code=500,
             detail="An error occurred while processing your subscription. Please try again later.",
@@ -118,37 +206,37 @@ async def subscribe(request: SubscribeRequest, db: Session = Depends(get_db)):
 
 
 # Unsubscribe endpoint
-@app.post("/unsubscribe", response_model=APIResponse)
-async def unsubscribe(request: UnsubscribeRequest, db: Session = Depends(get_db)):
+@app.post("/unsubscribe")
+async def unsubscribe(request: UnsubscribeRequest, db: AsyncSession = Depends(get_db)):
     try:
         subscriber_db = SubscriberDB(db)
-        subscriber_db.unsubscribe_subscriber(request.email)
+        await subscriber_db.unsubscribe_subscriber(request.email)
+        invalidate_stats_cache()
 
-        return APIResponse(
+        return api_response(
             success=True,
             message="Successfully unsubscribed from newsletter. We're sorry to see you go!",
             data={
                 "email": request.email,
-                "unsubscribed_at": datetime.utcnow().isoformat(),
+                "unsubscribed_at": utc_timestamp(),
             },
         )
     except ValueError as e:
         error_message = str(e)
         if "not found" in error_message:
-            return APIResponse(
+            return api_response(
                 success=False,
                 message="This email address is not in our subscriber list.",
             )
         elif "already unsubscribed" in error_message:
-            return APIResponse(
+            return api_response(
                 success=False,
                 message="This email is already unsubscribed from our newsletter.",
             )
         else:
-            return APIResponse(success=False, message=error_message)
+            return api_response(success=False, message=error_message)
     except Exception as e:
-        print(f"❌ Unsubscribe error: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("❌ Unsubscribe error: %s", e)
         raise HTTPException(
             status_code=500,
             detail="An error occurred while processing your unsubscription. Please try again later.",
@@ -157,53 +245,64 @@ async def unsubscribe(request: UnsubscribeRequest, db: Session = Depends(get_db)
 
 # Get subscriber statistics (admin endpoint)
 @app.get("/stats")
-async def get_stats(db: Session = Depends(get_db)):
+async def get_stats(db: AsyncSession = Depends(get_db)):
     try:
-        subscriber_db = SubscriberDB(db)
-        stats = subscriber_db.get_subscriber_count()
+        stats = await get_cached_subscriber_count(db)
 
-        return {"subscriber_stats": stats, "timestamp": datetime.utcnow().isoformat()}
+        return {"subscriber_stats": stats, "timestamp": utc_timestamp()}
     except Exception as e:
-        print(f"❌ Stats error: {str(e)}")
+        logger.error("❌ Stats error: %s", e)
         raise HTTPException(
             status_code=500, detail="An error occurred while fetching statistics."
         )
 
 
-# Test endpoint for development
-@app.get("/test")
-async def test_endpoint():
-    return {
+# Test endpoint for development; nothing in it changes while the app runs
+_TEST_BODY = orjson.dumps(
+    {
         "message": "API is working!",
         "environment": {
             "cors_origins": origins,
             "database_url": os.getenv("DATABASE_URL", "sqlite:///./newsletter.db"),
         },
     }
+)
+
+
+@app.get("/test")
+async def test_endpoint():
+    return Response(_TEST_BODY, media_type="application/json")
 
 
 # Error handlers
+# Constant error bodies are serialized once. Each request still gets its own
+# Response, since middleware (CORS) appends headers to the one it is given.
+_NOT_FOUND_BODY = orjson.dumps({"detail": "Endpoint not found"})
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {"detail": "Internal server error. Please try again later."}
+)
+
+
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(status_code=404, content={"detail": "Endpoint not found"})
+    return Response(_NOT_FOUND_BODY, status_code=404, media_type="application/json")
 
 
 @app.exception_handler(422)
 async def validation_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": "Invalid input data. Please check your request and try again.",
-            "errors": exc.errors() if hasattr(exc, "errors") else [],
+            "errors": (exc.errors() if isinstance(exc, RequestValidationError) else []),
         },
     )
 
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal server error. Please try again later."},
+    return Response(
+        _INTERNAL_ERROR_BODY, status_code=500, media_type="application/json"
     )
 
 
@@ -213,10 +312,19 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
 
-    print(f"🚀 Starting server on {host}:{port}")
+    debug = os.getenv("DEBUG", "False").lower() == "true"
+    # Reload runs a single process; otherwise fan out across cores.
+    # uvicorn[standard] installs uvloop and httptools, which "auto" picks up.
+    workers = 1 if debug else int(os.getenv("WORKERS", os.cpu_count() or 2))
+
+    print(f"🚀 Starting server on {host}:{port} ({workers} worker(s))")
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
-        reload=True if os.getenv("DEBUG", "False").lower() == "true" else False,
+        reload=debug,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        access_log=False,
     )
@@ -1,14 +1,68 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict
+from typing import Annotated, Optional
 from datetime import datetime
+import os
+import re
+
+from email_validator import (
+    SPECIAL_USE_DOMAIN_NAMES,
+    EmailNotValidError,
+    validate_email,
+)
+
+# Plain ASCII addresses take a precompiled fast path; anything it doesn't
+# accept (quoted or unicode local parts, IDN domains, special-use domains
+# like .local or .test, typos) gets the full email-validator checks.
+# STRICT_EMAIL=1 always runs the full checks.
+STRICT_EMAIL = os.getenv("STRICT_EMAIL", "0") == "1"
+MAX_EMAIL_LENGTH = 254
+MAX_LOCAL_PART_LENGTH = 64
+_EMAIL_RE = re.compile(
+    r"[A-Za-z0-9_%+-]+(?:\.[A-Za-z0-9_%+-]+)*"
+    r"@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}"
+)
+
+
+def _is_special_use(domain: str) -> bool:
+    """True for domains email-validator rejects as special-use (.local, .test...)"""
+    domain = domain.lower()
+    return any(
+        domain == name or domain.endswith("." + name)
+        for name in SPECIAL_USE_DOMAIN_NAMES
+    )
+
+
+def _check_email(value: str) -> str:
+    """Validate an email address, lower-casing the domain like EmailStr does"""
+    local, _, domain = value.rpartition("@")
+    if len(value) > MAX_EMAIL_LENGTH or len(local) > MAX_LOCAL_PART_LENGTH:
+        raise ValueError("value is not a valid email address: too long")
+
+    if not STRICT_EMAIL and _EMAIL_RE.fullmatch(value) and not _is_special_use(domain):
+        return f"{local}@{domain.lower()}"
+
+    try:
+        return validate_email(value, check_deliverability=False).normalized
+    except EmailNotValidError as e:
+        raise ValueError(f"value is not a valid email address: {e}") from e
+
+
+EmailAddress = Annotated[str, AfterValidator(_check_email)]
+
+# Request bodies are read-only and carry nothing but the email
+_REQUEST_CONFIG = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
 
 
 class SubscribeRequest(BaseModel):
-    email: EmailStr
+    model_config = _REQUEST_CONFIG
+
+    email: EmailAddress
 
 
 class UnsubscribeRequest(BaseModel):
-    email: EmailStr
+    model_config = _REQUEST_CONFIG
+
+    email: EmailAddress
 
 
 class SubscriberResponse(BaseModel):
@@ -1,16 +1,115 @@
 import smtplib
 import os
 import time
+import asyncio
+import functools
+import logging
+import math
+import threading
+from collections import deque
+from collections.abc import Sized
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import List, Dict, Tuple
+from email.policy import SMTP as SMTP_POLICY
+from typing import AsyncIterable, Iterable, Iterator, List, Dict, Tuple, Union
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+UNSUBSCRIBE_PLACEHOLDER = "{{UNSUBSCRIBE_LINK}}"
+
+
+@functools.lru_cache(maxsize=8)
+def _split_unsubscribe_slots(html_content: str) -> Tuple[str, ...]:
+    """Split a template around its unsubscribe placeholders (once per template)"""
+    return tuple(html_content.split(UNSUBSCRIBE_PLACEHOLDER))
+
+
+def render_unsubscribe_link(html_content: str, unsubscribe_url: str) -> str:
+    """Fill every unsubscribe placeholder with the given URL"""
+    return unsubscribe_url.join(_split_unsubscribe_slots(html_content))
+
+
+def pipelined_sendmail(
+    server: smtplib.SMTP, from_addr: str, to_addrs: List[str], msg: bytes
+) -> Dict[str, Tuple[int, bytes]]:
+    """
+    smtplib's sendmail, but with MAIL FROM and every RCPT TO written in one
+    go when the server advertises PIPELINING (RFC 2920), so a batch costs one
+    round trip for its envelope instead of one per recipient
+    """
+    server.ehlo_or_helo_if_needed()
+    if not server.has_extn("pipelining"):
+        return server.sendmail(from_addr, to_addrs, msg)
+
+    mail_options = f" size={len(msg)}" if server.has_extn("size") else ""
+    commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}{mail_options}"]
+    commands += [f"RCPT TO:{smtplib.quoteaddr(addr)}" for addr in to_addrs]
+    server.send("".join(f"{command}\r\n" for command in commands))
+
+    # Every reply has to be read, in order, before anything else is sent
+    mail_code, mail_resp = server.getreply()
+    refused = {}
+    for addr in to_addrs:
+        code, resp = server.getreply()
+        if code not in (250, 251):
+            refused[addr] = (code, resp)
+
+    if mail_code != 250:
+        server.rset()
+        raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+    if len(refused) == len(to_addrs):
+        server.rset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+
+    code, resp = server.data(msg)
+    if code != 250:
+        server.rset()
+        raise smtplib.SMTPDataError(code, resp)
+    return refused
+
+
+class BatchPacer:
+    """Space batch starts at least `interval` seconds apart across threads"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next start slot and return how long to wait for it"""
+        if self.interval <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        return delay
+
+    def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 class EmailSender:
     def __init__(self):
@@ -20,13 +119,19 @@ class EmailSender:
         self.smtp_port = 587
         self.from_name = os.getenv("NEWSLETTER_FROM_NAME", "DataDispatch")
         self.max_batch_size = 50  # Gmail's BCC limit
+        # Concurrent SMTP sessions, and the minimum gap between batch starts
+        self.max_workers = int(os.getenv("SMTP_MAX_WORKERS", "4"))
+        self.batch_interval = float(os.getenv("SMTP_BATCH_INTERVAL", "2"))
+        # Session opened ahead of time by warmup_smtp()
+        self._warm_session = None
+        self._warmup_thread = None
 
         if not self.smtp_email or not self.smtp_password:
             raise ValueError("SMTP credentials not configured. Check your .env file.")
 
     def send_newsletter(
         self,
-        recipients: List[str],
+        recipients: Iterable[str],
         subject: str,
         html_content: str,
         unsubscribe_base_url: str = "https://your-domain.com/unsubscribe",
@@ -35,7 +140,7 @@ class EmailSender:
         Send newsletter to all recipients in batches
 
         Args:
-            recipients: List of email addresses
+            recipients: Email addresses (a list or a lazy stream)
             subject: Email subject line
             html_content: HTML email content
             unsubscribe_base_url: Base URL for unsubscribe links
@@ -44,114 +149,213 @@ class EmailSender:
             Dict with sending statistics
         """
         start_time = time.time()
-        total_sent = 0
-        total_failed = 0
-        failed_emails = []
+        num_batches = self._log_start(recipients)
+
+        # Batches are sliced off lazily as workers become free
 
-        print(f"📧 Starting newsletter send to {len(recipients)} recipients...")
+        # Each worker thread reuses its own authenticated session; batch starts
+        # are paced to respect Gmail limits while sends overlap
+        local = threading.local()
+        sessions = []
+        pacer = BatchPacer(self.batch_interval)
 
-        # Split recipients into batches
-        batches = self._create_batches(recipients, self.max_batch_size)
+        # Subject, body and unsubscribe link are the same for every batch
+        message = self._build_batch_message(subject, html_content, unsubscribe_base_url)
+        # The first worker to connect takes the warmed-up session, if any
+        warm = [server for server in [self._take_warm_session()] if server]
 
-        for i, batch in enumerate(batches):
-            print(f"📨 Sending batch {i+1}/{len(batches)} ({len(batch)} recipients)...")
+        def connect() -> smtplib.SMTP:
+            try:
+                local.server = warm.pop()
+            except IndexError:
+                local.server = self._connect()
+            sessions.append(local.server)
+            return local.server
+
+        def send(i: int, batch: List[str]) -> Dict:
+            pacer.wait()
+            logger.info(
+                "📨 Sending batch %d/%s (%d recipients)...",
+                i + 1,
+                num_batches,
+                len(batch),
+            )
 
             try:
-                batch_result = self._send_batch(
-                    batch, subject, html_content, unsubscribe_base_url
-                )
-                total_sent += batch_result["sent"]
-                total_failed += batch_result["failed"]
-                failed_emails.extend(batch_result["failed_emails"])
-
-                # Rate limiting: Wait between batches to respect Gmail limits
-                if i < len(batches) - 1:  # Don't wait after the last batch
-                    print("⏳ Waiting 2 seconds between batches...")
-                    time.sleep(2)
+                server = getattr(local, "server", None) or connect()
+                try:
+                    return self._send_batch(server, batch, message)
+                except smtplib.SMTPServerDisconnected:
+                    logger.warning("🔌 SMTP connection dropped, reconnecting...")
+                    return self._send_batch(connect(), batch, message)
 
             except Exception as e:
-                print(f"❌ Batch {i+1} failed completely: {str(e)}")
-                total_failed += len(batch)
-                failed_emails.extend(batch)
+                logger.error("❌ Batch %d failed completely: %s", i + 1, e)
+                local.server = None
+                return {"sent": 0, "failed": len(batch), "failed_emails": batch}
 
+        workers = max(1, self.max_workers)
+        results = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Keep only a couple of batches queued per worker
+                in_flight = deque()
+                for i, batch in enumerate(
+                    self._iter_batches(recipients, self.max_batch_size)
+                ):
+                    in_flight.append(executor.submit(send, i, batch))
+                    if len(in_flight) >= 2 * workers:
+                        results.append(in_flight.popleft().result())
+                results.extend(future.result() for future in in_flight)
+        finally:
+            # An unused warm session is closed along with the others
+            for server in sessions + warm:
+                try:
+                    server.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+
+        return self._summarize(results, start_time)
+
+    def _log_start(self, recipients: Iterable[str]) -> str:
+        """Log the start of a send; returns the batch total for progress messages"""
+        if not isinstance(recipients, Sized):
+            logger.info("📧 Starting newsletter send to streamed recipients...")
+            return "?"
+
+        logger.info("📧 Starting newsletter send to %d recipients...", len(recipients))
+        return str(math.ceil(len(recipients) / self.max_batch_size))
+
+    def _summarize(self, results: List[Dict], start_time: float) -> Dict:
+        """Build and log the sending statistics from per-batch results"""
         end_time = time.time()
         total_time = round(end_time - start_time, 2)
 
-        # Calculate statistics
-        success_rate = (total_sent / len(recipients)) * 100 if recipients else 0
+        # Recipients are counted from the batches, so streams work too
+        total_sent = sum(r["sent"] for r in results)
+        total_failed = sum(r["failed"] for r in results)
+        total_recipients = total_sent + total_failed
+        success_rate = (total_sent / total_recipients) * 100 if total_recipients else 0
 
         stats = {
-            "total_recipients": len(recipients),
+            "total_recipients": total_recipients,
             "sent": total_sent,
             "failed": total_failed,
             "success_rate": round(success_rate, 2),
             "total_time_seconds": total_time,
-            "failed_emails": failed_emails,
-            "batches_processed": len(batches),
+            "failed_emails": [email for r in results for email in r["failed_emails"]],
+            "batches_processed": len(results),
         }
 
-        print(f"✅ Newsletter sending completed!")
-        print(
-            f"📊 Sent: {total_sent}, Failed: {total_failed}, Success Rate: {success_rate:.1f}%"
+        logger.info("✅ Newsletter sending completed!")
+        logger.info(
+            "📊 Sent: %d, Failed: %d, Success Rate: %.1f%%",
+            total_sent,
+            total_failed,
+            success_rate,
         )
-        print(f"⏱️  Total time: {total_time}s")
+        logger.info("⏱️  Total time: %ss", total_time)
 
         return stats
 
-    def _create_batches(
-        self, recipients: List[str], batch_size: int
-    ) -> List[List[str]]:
-        """Split recipients into batches of specified size"""
-        batches = []
-        for i in range(0, len(recipients), batch_size):
-            batches.append(recipients[i : i + batch_size])
-        return batches
+    def _iter_batches(
+        self, recipients: Iterable[str], batch_size: int
+    ) -> Iterator[List[str]]:
+        """Yield recipients in batches of specified size"""
+        it = iter(recipients)
+        while batch := list(islice(it, batch_size)):
+            yield batch
+
+    def warmup_smtp(self) -> None:
+        """
+        Start opening an authenticated session in the background, so DNS,
+        TCP, TLS and AUTH overlap with content generation; the next
+        send_newsletter() picks it up
+        """
+
+        def warm() -> None:
+            try:
+                self._warm_session = self._connect()
+            except Exception as e:
+                logger.warning("⚠️  SMTP warmup failed: %s", e)
+
+        self._warmup_thread = threading.Thread(target=warm, daemon=True)
+        self._warmup_thread.start()
+
+    def _take_warm_session(self) -> smtplib.SMTP | None:
+        """Wait for a pending warmup and hand over its session"""
+        if self._warmup_thread is not None:
+            self._warmup_thread.join()
+            self._warmup_thread = None
+        server, self._warm_session = self._warm_session, None
+        return server
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP session"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.smtp_email or "", self.smtp_password or "")
+        return server
 
     def _send_batch(
         self,
+        server: smtplib.SMTP,
         recipients: List[str],
-        subject: str,
-        html_content: str,
-        unsubscribe_base_url: str,
+        message: bytes,
     ) -> Dict:
-        """Send email to a batch of recipients using BCC"""
+        """
+        Send a pre-rendered message to a batch of recipients using BCC over an
+        open session. SMTPServerDisconnected is raised so the caller can reconnect.
+        """
         try:
-            # Create SMTP connection
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.smtp_email or "", self.smtp_password or "")
-
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["From"] = f"{self.from_name} <{self.smtp_email}>"
-            message["Subject"] = subject
-            message["Reply-To"] = self.smtp_email or ""
+            # Send with BCC
+            all_recipients = [self.smtp_email or ""] + recipients
+            refused = pipelined_sendmail(
+                server, self.smtp_email or "", all_recipients, message
+            )
 
-            # Add unsubscribe link to content
-            unsubscribe_link = f"{unsubscribe_base_url}?email={{email}}"
-            final_html = html_content.replace("{{UNSUBSCRIBE_LINK}}", unsubscribe_link)
+            return self._batch_result(recipients, refused)
 
-            # Create HTML part
-            html_part = MIMEText(final_html, "html")
-            message.attach(html_part)
+        except smtplib.SMTPServerDisconnected:
+            raise
+        except Exception as e:
+            logger.error("❌ Batch sending failed: %s", e)
+            return {"sent": 0, "failed": len(recipients), "failed_emails": recipients}
 
-            # Send to batch using BCC
-            message["To"] = self.smtp_email or ""  # Send to self as primary recipient
+    @staticmethod
+    def _batch_result(recipients: List[str], refused: Dict) -> Dict:
+        """Batch statistics; recipients the server refused count as failed"""
+        failed = [email for email in recipients if email in refused]
+        if failed:
+            logger.warning("⚠️  Server refused %d recipients", len(failed))
+        return {
+            "sent": len(recipients) - len(failed),
+            "failed": len(failed),
+            "failed_emails": failed,
+        }
 
-            # Convert message to string
-            text = message.as_string()
+    def _build_batch_message(
+        self, subject: str, html_content: str, unsubscribe_base_url: str
+    ) -> bytes:
+        """Render the wire bytes sent to every batch (recipients go in BCC)"""
+        message = MIMEMultipart("alternative")
+        message["From"] = f"{self.from_name} <{self.smtp_email}>"
+        message["Subject"] = subject
+        message["Reply-To"] = self.smtp_email or ""
 
-            # Send with BCC
-            all_recipients = [self.smtp_email or ""] + recipients
-            server.sendmail(self.smtp_email or "", all_recipients, text)
+        # Add unsubscribe link to content
+        unsubscribe_link = f"{unsubscribe_base_url}?email={{email}}"
+        final_html = render_unsubscribe_link(html_content, unsubscribe_link)
 
-            server.quit()
+        # Create HTML part
+        html_part = MIMEText(final_html, "html")
+        message.attach(html_part)
 
-            return {"sent": len(recipients), "failed": 0, "failed_emails": []}
+        # Send to batch using BCC
+        message["To"] = self.smtp_email or ""  # Send to self as primary recipient
 
-        except Exception as e:
-            print(f"❌ Batch sending failed: {str(e)}")
-            return {"sent": 0, "failed": len(recipients), "failed_emails": recipients}
+        # smtplib only fixes line endings for str messages; bytes must be CRLF
+        return message.as_bytes(policy=SMTP_POLICY)
 
     def send_single_email(
         self,
@@ -186,12 +390,7 @@ class EmailSender:
             message["Reply-To"] = self.smtp_email or ""
 
             # Add unsubscribe link if provided
-            if unsubscribe_url:
-                final_html = html_content.replace(
-                    "{{UNSUBSCRIBE_LINK}}", unsubscribe_url
-                )
-            else:
-                final_html = html_content.replace("{{UNSUBSCRIBE_LINK}}", "#")
+            final_html = render_unsubscribe_link(html_content, unsubscribe_url or "#")
 
             # Create HTML part
             html_part = MIMEText(final_html, "html")
@@ -201,39 +400,41 @@ class EmailSender:
             server.sendmail(self.smtp_email or "", [recipient], message.as_string())
             server.quit()
 
-            print(f"✅ Email sent successfully to {recipient}")
+            logger.info("✅ Email sent successfully to %s", recipient)
             return True
 
         except Exception as e:
-            print(f"❌ Failed to send email to {recipient}: {str(e)}")
+            logger.error("❌ Failed to send email to %s: %s", recipient, e)
             return False
 
     def test_smtp_connection(self) -> bool:
         """Test SMTP connection and credentials"""
         try:
-            print("🔌 Testing SMTP connection...")
+            logger.info("🔌 Testing SMTP connection...")
 
             server = smtplib.SMTP(self.smtp_server, self.smtp_port)
             server.starttls()
             server.login(self.smtp_email or "", self.smtp_password or "")
             server.quit()
 
-            print("✅ SMTP connection successful!")
+            logger.info("✅ SMTP connection successful!")
             return True
 
         except smtplib.SMTPAuthenticationError:
-            print("❌ SMTP Authentication failed. Check your email and password.")
-            print(
+            logger.error(
+                "❌ SMTP Authentication failed. Check your email and password."
+            )
+            logger.error(
                 "💡 Make sure you're using a Gmail App Password, not your regular password."
             )
             return False
         except smtplib.SMTPConnectError:
-            print(
+            logger.error(
                 "❌ Could not connect to SMTP server. Check your internet connection."
             )
             return False
         except Exception as e:
-            print(f"❌ SMTP connection failed: {str(e)}")
+            logger.error("❌ SMTP connection failed: %s", e)
             return False
 
     def send_test_email(self) -> bool:
@@ -286,8 +487,197 @@ class EmailSender:
         )
 
 
+class AsyncEmailSender(EmailSender):
+    """EmailSender that can also send batches concurrently over aiosmtplib.
+
+    The inherited send_newsletter()/warmup_smtp() keep working as in
+    EmailSender; the coroutine pair is warmup_smtp_async()/send_newsletter_async().
+    """
+
+    def __init__(self, max_concurrency: int | None = None):
+        if aiosmtplib is None:
+            raise ImportError("aiosmtplib is required for AsyncEmailSender")
+        super().__init__()
+        self.max_concurrency = max_concurrency or self.max_workers
+        self._warm_sessions: List["aiosmtplib.SMTP"] = []
+
+    async def warmup_smtp_async(self) -> None:
+        """
+        Open one authenticated session per worker ahead of send_newsletter_async(),
+        e.g. while content is generated; must run on the same event loop
+        """
+        sessions = await asyncio.gather(
+            *(self._connect_async() for _ in range(max(1, self.max_concurrency))),
+            return_exceptions=True,
+        )
+        for session in sessions:
+            if isinstance(session, Exception):
+                logger.warning("⚠️  SMTP warmup failed: %s", session)
+            else:
+                self._warm_sessions.append(session)
+
+    async def send_newsletter_async(
+        self,
+        recipients: Union[Iterable[str], AsyncIterable[str]],
+        subject: str,
+        html_content: str,
+        unsubscribe_base_url: str = "https://your-domain.com/unsubscribe",
+    ) -> Dict:
+        """
+        Send newsletter to all recipients, up to max_concurrency batches at once.
+        Recipients may be a list or an async stream (e.g. straight from the DB).
+
+        Returns:
+            Dict with sending statistics (same shape as EmailSender)
+        """
+        start_time = time.time()
+        num_batches = self._log_start(recipients)
+        message = self._build_batch_message(subject, html_content, unsubscribe_base_url)
+
+        # One producer slices batches into a bounded queue, so at most
+        # max_concurrency batches are held in memory at a time
+        workers = max(1, self.max_concurrency)
+        batches: asyncio.Queue = asyncio.Queue(maxsize=workers)
+
+        async def produce() -> None:
+            try:
+                i = 0
+                async for batch in self._aiter_batches(recipients, self.max_batch_size):
+                    await batches.put((i, batch))
+                    i += 1
+            finally:
+                for _ in range(workers):
+                    await batches.put(None)
+
+        # Batch starts are spaced across all sessions so Gmail doesn't
+        # answer with 421 throttling
+        pacer = BatchPacer(self.batch_interval)
+
+        async def worker() -> List[Dict]:
+            # Each worker keeps one authenticated session for its whole run
+            server = None
+            results = []
+            try:
+                while (item := await batches.get()) is not None:
+                    i, batch = item
+                    await pacer.wait_async()
+                    logger.info(
+                        "📨 Sending batch %d/%s (%d recipients)...",
+                        i + 1,
+                        num_batches,
+                        len(batch),
+                    )
+
+                    try:
+                        if server is None:
+                            server = (
+                                self._warm_sessions.pop()
+                                if self._warm_sessions
+                                else await self._connect_async()
+                            )
+                        try:
+                            result = await self._send_batch_async(
+                                server, batch, message
+                            )
+                        except aiosmtplib.SMTPServerDisconnected:
+                            logger.warning(
+                                "🔌 SMTP connection dropped, reconnecting..."
+                            )
+                            server = await self._connect_async()
+                            result = await self._send_batch_async(
+                                server, batch, message
+                            )
+                    except Exception as e:
+                        logger.error("❌ Batch %d failed completely: %s", i + 1, e)
+                        # Drop the broken session without leaking its socket
+                        if server is not None:
+                            server.close()
+                        server = None
+                        result = {
+                            "sent": 0,
+                            "failed": len(batch),
+                            "failed_emails": batch,
+                        }
+                    results.append(result)
+            finally:
+                if server is not None:
+                    try:
+                        await server.quit()
+                    except (aiosmtplib.SMTPException, OSError):
+                        pass
+            return results
+
+        # Wait for every task even if the producer fails (e.g. a DB read):
+        # its sentinels still stop the workers, which quit their sessions
+        outcomes = await asyncio.gather(
+            produce(), *(worker() for _ in range(workers)), return_exceptions=True
+        )
+        # Workers that never got a batch leave their warm session behind
+        while self._warm_sessions:
+            try:
+                await self._warm_sessions.pop().quit()
+            except (aiosmtplib.SMTPException, OSError):
+                pass
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        results = [r for worker_results in outcomes[1:] for r in worker_results]
+        return self._summarize(results, start_time)
+
+    async def _aiter_batches(
+        self, recipients: Union[Iterable[str], AsyncIterable[str]], batch_size: int
+    ) -> AsyncIterable[List[str]]:
+        """Yield batches from a list or an async stream of recipients"""
+        if not hasattr(recipients, "__aiter__"):
+            for batch in self._iter_batches(recipients, batch_size):
+                yield batch
+            return
+
+        batch = []
+        async for email in recipients:
+            batch.append(email)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _connect_async(self) -> "aiosmtplib.SMTP":
+        """Open an authenticated aiosmtplib session"""
+        server = aiosmtplib.SMTP(
+            hostname=self.smtp_server, port=self.smtp_port, start_tls=False
+        )
+        await server.connect()
+        await server.starttls()
+        await server.login(self.smtp_email or "", self.smtp_password or "")
+        return server
+
+    async def _send_batch_async(
+        self, server: "aiosmtplib.SMTP", recipients: List[str], message: bytes
+    ) -> Dict:
+        """
+        Send a pre-rendered message to a batch of recipients using BCC over an
+        open session. SMTPServerDisconnected is raised so the caller can reconnect.
+        """
+        try:
+            all_recipients = [self.smtp_email or ""] + recipients
+            refused, _ = await server.sendmail(
+                self.smtp_email or "", all_recipients, message
+            )
+
+            return self._batch_result(recipients, refused)
+
+        except aiosmtplib.SMTPServerDisconnected:
+            raise
+        except Exception as e:
+            logger.error("❌ Batch sending failed: %s", e)
+            return {"sent": 0, "failed": len(recipients), "failed_emails": recipients}
+
+
 def main():
     """Test the email sender"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("📧 Testing Email Sender...")
 
     try:
@@ -4,64 +4,116 @@ Send custom newsletter to all subscribers
 Usage: python send_to_all.py [--subject "Custom Subject"] [--generate-content]
 """
 
-import sys
 import os
 from pathlib import Path
 
-# Add project paths
+# backend/, ai_agent/ and mailer/ import as packages from the project root,
+# which Python already puts on sys.path for this script
 current_dir = Path(__file__).parent.absolute()
-sys.path.insert(0, str(current_dir / "backend"))
-sys.path.insert(0, str(current_dir / "ai_agent"))
-sys.path.insert(0, str(current_dir / "mailer"))
 
-from backend.database import init_db, SubscriberDB, get_db
-from mailer.email_sender import EmailSender
+from dotenv import load_dotenv
+
+load_dotenv()
+# Relative SQLite paths live in backend/, next to the API's database; pin
+# them before the engine is built so no chdir is needed around DB calls
+_SQLITE_RELATIVE = "sqlite:///./"
+_db_url = os.getenv("DATABASE_URL", f"{_SQLITE_RELATIVE}newsletter.db")
+if _db_url.startswith(_SQLITE_RELATIVE):
+    _db_path = current_dir / "backend" / _db_url[len(_SQLITE_RELATIVE) :]
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+from backend.database import init_db, SubscriberDB, SendLogDB, SessionLocal, engine
+from mailer.email_sender import EmailSender, AsyncEmailSender, aiosmtplib
 from ai_agent.content_generator import ContentGenerator
 import argparse
+import asyncio
+import logging
 from datetime import datetime
 
-
-def main():
-    parser = argparse.ArgumentParser(description="Send newsletter to all subscribers")
-    parser.add_argument(
-        "--subject", default="DataDispatch Newsletter", help="Email subject"
+UNSUBSCRIBE_BASE_URL = "http://localhost:3000/unsubscribe.html"
+# Active emails read per short transaction while a send is running
+EMAIL_PAGE_SIZE = 1000
+# Failed addresses kept in a send log's error_details
+ERROR_SAMPLE_SIZE = 5
+
+
+async def fetch_active_emails():
+    """Initialize the database and load the active subscribers' emails"""
+    await init_db()
+    try:
+        async with SessionLocal() as db_session:
+            subscriber_db = SubscriberDB(db_session)
+            return [email async for email in subscriber_db.iter_active_emails()]
+    finally:
+        # The pool's connections belong to this event loop
+        await engine.dispose()
+
+
+async def iter_active_email_pages():
+    """
+    Yield active subscribers' emails page by page. Each page is read in its
+    own short session, so no transaction stays open while batches are sent.
+    """
+    after = ""
+    while True:
+        async with SessionLocal() as db_session:
+            page = await SubscriberDB(db_session).get_active_emails_page(
+                after, EMAIL_PAGE_SIZE
+            )
+        for email in page:
+            yield email
+        if len(page) < EMAIL_PAGE_SIZE:
+            return
+        after = page[-1]
+
+
+async def count_active_subscribers():
+    """Initialize the database and count the active subscribers"""
+    await init_db()
+    try:
+        async with SessionLocal() as db_session:
+            return (await SubscriberDB(db_session).get_subscriber_count())["active"]
+    finally:
+        await engine.dispose()
+
+
+def summarize_failures(failed_emails):
+    """Failure count plus a short sample of the addresses, not the full list"""
+    if not failed_emails:
+        return None
+    summary = f"{len(failed_emails)} failed: "
+    summary += ", ".join(failed_emails[:ERROR_SAMPLE_SIZE])
+    if len(failed_emails) > ERROR_SAMPLE_SIZE:
+        summary += f" (+{len(failed_emails) - ERROR_SAMPLE_SIZE} more)"
+    return summary
+
+
+async def log_send_stats(db_session, stats, subject):
+    """Record the run's statistics in send_logs"""
+    await SendLogDB(db_session).create_send_logs(
+        [
+            {
+                "sent_count": stats["sent"],
+                "failures": stats["failed"],
+                "latency_ms": int(stats["total_time_seconds"] * 1000),
+                "error_details": summarize_failures(stats["failed_emails"]),
+                "newsletter_subject": subject,
+            }
+        ]
     )
-    parser.add_argument(
-        "--generate-content", action="store_true", help="Generate fresh AI content"
-    )
-    parser.add_argument("--file", help="Use content from HTML file")
 
-    args = parser.parse_args()
 
-    print(f"📧 DataDispatch Mass Email Sender")
-    print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 50)
-
-    # Initialize database
-    print("💾 Connecting to database...")
-    # Change to backend directory to use the existing backend/newsletter.db
-    import os
-    original_cwd = os.getcwd()
-    os.chdir('backend')
-    init_db()
-    
-    # Get subscribers (while still in backend directory)
-    print("👥 Fetching subscribers...")
-    db_session = next(get_db())
-    db = SubscriberDB(db_session)
-    subscribers = db.get_active_subscribers()
-    
-    if not subscribers:
-        print("❌ No active subscribers found!")
-        os.chdir(original_cwd)  # Change back before returning
-        return
+async def save_send_stats(stats, subject):
+    """Record the run's statistics from outside an event loop"""
+    try:
+        async with SessionLocal() as db_session:
+            await log_send_stats(db_session, stats, subject)
+    finally:
+        await engine.dispose()
 
-    print(f"📊 Found {len(subscribers)} active subscribers")
-    
-    # Change back to original directory for the rest of the operations
-    os.chdir(original_cwd)
 
-    # Get content
+def load_content(args):
+    """Generate or load the newsletter; returns (subject, html_content)"""
     if args.generate_content:
         print("🤖 Generating fresh AI content...")
         generator = ContentGenerator()
@@ -81,28 +133,92 @@ def main():
         html_content = SAMPLE_NEWSLETTER_CONTENT["html"]
         subject = args.subject
 
-    # Send emails
     print(f"📧 Sending newsletter: '{subject}'")
     print(f"📄 Content length: {len(html_content)} characters")
+    return subject or "DataDispatch Newsletter", html_content
+
+
+async def stream_newsletter(args):
+    """Send to active subscribers as their emails are paged out of the database"""
+    sender = AsyncEmailSender()
+    # SMTP sessions are opened while the content is generated
+    (subject, html_content), _ = await asyncio.gather(
+        asyncio.to_thread(load_content, args), sender.warmup_smtp_async()
+    )
+    try:
+        stats = await sender.send_newsletter_async(
+            recipients=iter_active_email_pages(),
+            subject=subject,
+            html_content=html_content,
+            unsubscribe_base_url=UNSUBSCRIBE_BASE_URL,
+        )
+        async with SessionLocal() as db_session:
+            await log_send_stats(db_session, stats, subject)
+        return stats
+    finally:
+        await engine.dispose()
 
-    sender = EmailSender()
-    emails = [sub.email for sub in subscribers]
 
-    success = sender.send_newsletter(
-        recipients=emails,
-        subject=subject or "DataDispatch Newsletter",
-        html_content=html_content,
-        unsubscribe_base_url="http://localhost:3000/unsubscribe.html",
+def main():
+    parser = argparse.ArgumentParser(description="Send newsletter to all subscribers")
+    parser.add_argument(
+        "--subject", default="DataDispatch Newsletter", help="Email subject"
     )
+    parser.add_argument(
+        "--generate-content", action="store_true", help="Generate fresh AI content"
+    )
+    parser.add_argument("--file", help="Use content from HTML file")
+
+    args = parser.parse_args()
+    # Show the sender's progress messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    print(f"📧 DataDispatch Mass Email Sender")
+    print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
 
-    if success:
+    # Initialize database
+    print("💾 Connecting to database...")
+
+    # Get subscribers
+    print("👥 Fetching subscribers...")
+    # With aiosmtplib the emails are streamed at send time instead of
+    # being loaded into a list up front
+    streaming = aiosmtplib is not None
+    if streaming:
+        subscriber_count = asyncio.run(count_active_subscribers())
+    else:
+        emails = asyncio.run(fetch_active_emails())
+        subscriber_count = len(emails)
+
+    if not subscriber_count:
+        print("❌ No active subscribers found!")
+        return
+
+    print(f"📊 Found {subscriber_count} active subscribers")
+
+    # Get content and send emails; batches go out concurrently when
+    # aiosmtplib is installed
+    if streaming:
+        stats = asyncio.run(stream_newsletter(args))
+    else:
+        sender = EmailSender()
+        # Connect to SMTP in the background while the content is prepared
+        sender.warmup_smtp()
+        subject, html_content = load_content(args)
+        stats = sender.send_newsletter(
+            recipients=emails,
+            subject=subject,
+            html_content=html_content,
+            unsubscribe_base_url=UNSUBSCRIBE_BASE_URL,
+        )
+        asyncio.run(save_send_stats(stats, subject))
+
+    if stats:
         print("✅ Newsletter sent successfully to all subscribers!")
     else:
         print("❌ Failed to send newsletter")
 
-    # Close database session
-    db_session.close()
-
 
 if __name__ == "__main__":
     main()
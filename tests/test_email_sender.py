@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+import mailer.email_sender as email_sender
+
+REFUSED = "refused@example.com"
+RECIPIENTS = ["a@example.com", REFUSED, "b@example.com"]
+
+
+class FakeSMTP:
+    """smtplib.SMTP stand-in without PIPELINING that refuses one recipient"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def ehlo_or_helo_if_needed(self):
+        pass
+
+    def has_extn(self, name):
+        return False
+
+    def sendmail(self, sender, recipients, message):
+        return {REFUSED: (550, b"No such user")}
+
+    def quit(self):
+        pass
+
+
+class FakeAsyncSMTP:
+    """aiosmtplib.SMTP stand-in that refuses one recipient"""
+
+    opened = []
+
+    def __init__(self, *args, **kwargs):
+        self.quit_called = False
+        FakeAsyncSMTP.opened.append(self)
+
+    async def connect(self):
+        pass
+
+    async def starttls(self):
+        pass
+
+    async def login(self, user, password):
+        pass
+
+    async def sendmail(self, sender, recipients, message):
+        refused = {r: (550, "No such user") for r in recipients if r == REFUSED}
+        return refused, "OK"
+
+    async def quit(self):
+        self.quit_called = True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def smtp_env(monkeypatch):
+    monkeypatch.setenv("SMTP_EMAIL", "me@example.com")
+    monkeypatch.setenv("SMTP_PASSWORD", "secret")
+    monkeypatch.setenv("SMTP_BATCH_INTERVAL", "0")
+    monkeypatch.setattr(email_sender.smtplib, "SMTP", FakeSMTP)
+
+
+@pytest.fixture
+def async_sender(monkeypatch):
+    pytest.importorskip("aiosmtplib")
+    monkeypatch.setattr(email_sender.aiosmtplib, "SMTP", FakeAsyncSMTP)
+    FakeAsyncSMTP.opened = []
+    return email_sender.AsyncEmailSender(max_concurrency=3)
+
+
+def test_refused_recipients_count_as_failed():
+    stats = email_sender.EmailSender().send_newsletter(
+        RECIPIENTS, "Subject", "<p>Hi</p>"
+    )
+    assert stats["sent"] == 2
+    assert stats["failed"] == 1
+    assert stats["failed_emails"] == [REFUSED]
+
+
+def test_async_refused_recipients_count_as_failed(async_sender):
+    stats = asyncio.run(
+        async_sender.send_newsletter_async(RECIPIENTS, "Subject", "<p>Hi</p>")
+    )
+    assert stats["sent"] == 2
+    assert stats["failed"] == 1
+    assert stats["failed_emails"] == [REFUSED]
+
+
+def test_failing_recipient_stream_closes_sessions_and_raises(async_sender):
+    async def recipients():
+        for i in range(120):
+            yield f"user{i}@example.com"
+        raise RuntimeError("database went away")
+
+    async def scenario():
+        await async_sender.warmup_smtp_async()
+        await asyncio.wait_for(
+            async_sender.send_newsletter_async(recipients(), "Subject", "<p>Hi</p>"),
+            5,
+        )
+
+    with pytest.raises(RuntimeError, match="database went away"):
+        asyncio.run(scenario())
+    assert FakeAsyncSMTP.opened
+    assert all(session.quit_called for session in FakeAsyncSMTP.opened)
@@ -0,0 +1,25 @@
+import pytest
+from pydantic import ValidationError
+
+from backend.models import SubscribeRequest
+
+
+def test_plain_address_lowercases_domain():
+    assert SubscribeRequest(email="User@Example.COM").email == "User@example.com"
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "user@foo.local",
+        "user@localhost",
+        "user@foo.localhost",
+        "user@foo.test",
+        "user@foo.invalid",
+        "user@foo.onion",
+        "user@FOO.LOCAL",
+    ],
+)
+def test_special_use_domains_are_rejected(email):
+    with pytest.raises(ValidationError, match="not a valid email address"):
+        SubscribeRequest(email=email)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from backend.database import SubscribeBatcher, SubscriberDB, engine, init_db
+
+
+def test_cancel_during_fallback_keeps_batcher_running(monkeypatch):
+    async def scenario():
+        await init_db()
+        writing = asyncio.Event()
+        release = asyncio.Event()
+
+        async def failing_bulk(self, emails):
+            if len(emails) > 1:
+                raise RuntimeError("bad row in batch")
+            return {email: email for email in emails}
+
+        async def slow_single(self, email):
+            writing.set()
+            await release.wait()
+            return email
+
+        monkeypatch.setattr(SubscriberDB, "create_subscribers", failing_bulk)
+        monkeypatch.setattr(SubscriberDB, "create_subscriber", slow_single)
+
+        batcher = SubscribeBatcher()
+        first = asyncio.create_task(batcher.subscribe("first@example.com"))
+        second = asyncio.create_task(batcher.subscribe("second@example.com"))
+
+        # Cancel the first caller while the one-by-one retry is writing it
+        await writing.wait()
+        first.cancel()
+        release.set()
+
+        assert await asyncio.wait_for(second, 1) == "second@example.com"
+        assert first.cancelled()
+
+        # The drain loop survived and still answers new callers
+        third = batcher.subscribe("third@example.com")
+        assert await asyncio.wait_for(third, 1) == "third@example.com"
+
+        await batcher.stop()
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_unexpected_write_error_fails_only_its_batch(monkeypatch):
+    async def scenario():
+        await init_db()
+        calls = []
+
+        async def flaky_write(self, batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            for email, future in batch:
+                future.set_result(email)
+
+        monkeypatch.setattr(SubscribeBatcher, "_write", flaky_write)
+
+        batcher = SubscribeBatcher()
+        with pytest.raises(RuntimeError, match="boom"):
+            await asyncio.wait_for(batcher.subscribe("first@example.com"), 1)
+
+        following = batcher.subscribe("next@example.com")
+        assert await asyncio.wait_for(following, 1) == "next@example.com"
+
+        await batcher.stop()
+        await engine.dispose()
+
+    asyncio.run(scenario())